@@ -6,5 +6,6 @@ setup(
     description="A tool for skeleton augmentation",
     author="Mickael Cormier, Yannik Schmid",
     author_email="mickael.cormier@iosb.fraunhofer.de",
-    install_requires=["numpy", "scipy"],
+    install_requires=["numpy"],
+    extras_require={"numba": ["numba"]},
 )
@@ -0,0 +1,64 @@
+# Numeric kernels of the transforms. They are compiled with Numba if it is installed,
+# otherwise the transforms fall back to their NumPy implementations.
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def interpolate_occlusions(keypoints, invalid):
+    # Fills every run of invalid frames between two valid frames of a keypoint in place
+    length, num_joints, num_channels = keypoints.shape
+    for k in range(num_joints):
+        last_valid = -1
+        for t in range(length):
+            if invalid[t, k]:
+                continue
+            if last_valid >= 0 and t - last_valid > 1:
+                for i in range(last_valid + 1, t):
+                    weight = (i - last_valid) / (t - last_valid)
+                    for c in range(num_channels):
+                        start = keypoints[last_valid, k, c]
+                        keypoints[i, k, c] = start + (keypoints[t, k, c] - start) * weight
+                    invalid[i, k] = False
+            last_valid = t
+
+
+def clip_bb(keypoints, bottom_left, top_right, directions):
+    # Moves each keypoint back along its direction until it is inside its bounding box, in place
+    for i in range(keypoints.shape[0]):
+        dm = 0.0  # Distance in direction the keypoint is outside of bb
+        for c in range(keypoints.shape[1]):
+            if directions[i, c] == 0.0:
+                continue
+            db = min(keypoints[i, c] - bottom_left[i, c], 0.0)
+            dt = max(keypoints[i, c] - top_right[i, c], 0.0)
+            dm = max(dm, db / directions[i, c], dt / directions[i, c])
+        for c in range(keypoints.shape[1]):
+            keypoints[i, c] -= dm * directions[i, c]
+
+
+def window_max_sum(values, size):
+    # Returns the start of the first contiguous window of `size` values with the largest sum
+    if size >= len(values):
+        return 0
+    window_sum = 0.0
+    for i in range(size):
+        window_sum += values[i]
+    max_sum = window_sum
+    max_index = 0
+    for i in range(size, len(values)):
+        window_sum += values[i] - values[i - size]
+        if window_sum > max_sum:
+            max_sum = window_sum
+            max_index = i - size + 1
+    return max_index
+
+
+if NUMBA_AVAILABLE:
+    interpolate_occlusions = njit(cache=True)(interpolate_occlusions)
+    clip_bb = njit(cache=True)(clip_bb)
+    window_max_sum = njit(cache=True)(window_max_sum)
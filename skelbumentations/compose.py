@@ -1,5 +1,5 @@
 import random
-from typing import Any
+from typing import Any, Union
 
 import numpy as np
 
@@ -28,11 +28,21 @@ class Compose(BaseCompose):
         transforms: list of transformations to compose.
         p (float, optional):  probability of applying all list of transforms. Defaults to 1.0.
         set_invalid_to_zero (bool, optional): if invalid keypoints should be set to zero. Defaults to True.
+        dtype (np.dtype | None, optional): dtype the keypoints are converted to before the transforms are applied.
+            np.float32 halves the memory traffic of every transform and is precise enough for pixel coordinates.
+            None keeps the dtype of the passed keypoints. Defaults to None.
     """
 
-    def __init__(self, transforms, p: float = 1.0, set_invalid_to_zero: bool = True):
+    def __init__(
+        self,
+        transforms,
+        p: float = 1.0,
+        set_invalid_to_zero: bool = True,
+        dtype: Union[np.dtype, type, None] = None,
+    ):
         super().__init__(transforms, p)
         self.set_invalid_to_zero = set_invalid_to_zero
+        self.dtype = dtype
 
     def __call__(self, *args, force_apply: bool = False, **data):
         if args:
@@ -47,15 +57,48 @@ class Compose(BaseCompose):
         for t in transforms:
             data = t(**data)
 
-        if self.set_invalid_to_zero:
+        if self.set_invalid_to_zero and data["invalid"].any():
             data["keypoints"][data["invalid"]] = 0.0
 
         return data
 
+    def apply_batch(self, keypoints: np.ndarray, invalid: Union[np.ndarray, None] = None):
+        """Apply the transforms to every sequence of a batch. The sequences are augmented independently.
+        The batch arrays are modified in place, unless `dtype` converts the keypoints to a copy.
+        Only the returned dict is guaranteed to hold the augmented batch.
+
+        Args:
+            keypoints (np.ndarray): batch of pose sequences with the format (B,T,V,C).
+            invalid (np.ndarray | None, optional): boolean map with the shape (B,T,V). Defaults to None.
+
+        Returns:
+            dict: the augmented batch with `keypoints` and `invalid`.
+        """
+        assert keypoints.ndim == 4, "keypoints has to be a batch of pose sequences with the format (B,T,V,C)"
+        if self.dtype is not None:
+            keypoints = np.ascontiguousarray(keypoints, dtype=self.dtype)
+        if invalid is None:
+            invalid = np.full(keypoints.shape[:-1], False)
+        else:
+            assert invalid.shape == keypoints.shape[:-1]
+
+        for b in range(len(keypoints)):
+            sample = {"keypoints": keypoints[b], "invalid": invalid[b]}
+            data = self(**sample)
+            # Transforms usually modify the views in place, only write back replaced arrays
+            for key in sample:
+                if data[key] is not sample[key]:
+                    sample[key][:] = data[key]
+
+        return {"keypoints": keypoints, "invalid": invalid}
+
     def check_args(self, **data):
         if "keypoints" not in data:
             raise KeyError("You have to pass keypoints to the augmentations")
 
+        if self.dtype is not None:
+            data["keypoints"] = np.ascontiguousarray(data["keypoints"], dtype=self.dtype)
+
         if "invalid" not in data:
             data["invalid"] = np.full(data["keypoints"].shape[:-1], False)
         else:
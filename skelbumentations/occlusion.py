@@ -2,9 +2,8 @@ import random
 from typing import Union
 
 import numpy as np
-from scipy import interpolate
 
-from . import random_utils
+from . import _kernels, random_utils
 from .transform import BaseTransform
 
 
@@ -18,15 +17,11 @@ class RandomOcclusion(BaseTransform):
 
     def __init__(self, chance: Union[float, list[float]], always_apply=False, p=1.0):
         super().__init__(always_apply, p)
-        self.chance = chance
+        self.chance = np.asarray(chance, dtype=np.float64)
 
     def apply(self, **data):
         num_joints = data["invalid"].shape[1]
-        occluded_joints = []
-        for i in range(num_joints):
-            chance = self.chance if type(self.chance) == float else self.chance[i]
-            if random_utils.uniform() < chance:
-                occluded_joints.append(i)
+        occluded_joints = random_utils.uniform(size=num_joints) < self.chance
         data["invalid"][:, occluded_joints] = True
         return data
 
@@ -56,7 +51,7 @@ class SpecificOcclusion(BaseTransform):
 
     def __init__(self, joints: list[int], always_apply=False, p=1.0):
         super().__init__(always_apply, p)
-        self.joints = joints
+        self.joints = np.asarray(joints, dtype=np.intp)
 
     def apply(self, **data):
         data["invalid"][:, self.joints] = True
@@ -76,29 +71,34 @@ class InterpolateOcclusions(BaseTransform):
         self.max_frames = 25
 
     def apply(self, **data):
+        if _kernels.NUMBA_AVAILABLE:
+            _kernels.interpolate_occlusions(data["keypoints"], data["invalid"])
+            return data
+
         # T V C
+        length = data["keypoints"].shape[0]
+        frame_ids = np.arange(length)
         for k in range(data["keypoints"].shape[1]):
             kp = data["keypoints"][:, k]
-            length = data["keypoints"].shape[0]
             invalid = data["invalid"][:, k]
             valid = np.logical_not(invalid)
-            valid_ids = np.arange(length)[valid]
+            valid_ids = frame_ids[valid]
             # At least two valid points needed to interpolate in between
             if valid_ids.size < 2:
                 continue
             valid_kps = kp[valid]
-            f = interpolate.interp1d(valid_ids, valid_kps, axis=0)
-            min_valid_id = np.min(valid_ids)
-            max_valid_id = np.max(valid_ids)
+            min_valid_id = valid_ids[0]
+            max_valid_id = valid_ids[-1]
 
             interpolate_map = invalid.copy()
 
             # Prevent extrapolating
             interpolate_map[:min_valid_id] = False
             interpolate_map[max_valid_id:] = False
-            interpolate_ids = np.arange(length)[interpolate_map]
+            interpolate_ids = frame_ids[interpolate_map]
 
-            data["keypoints"][interpolate_map, k] = f(interpolate_ids)
+            for c in range(kp.shape[1]):
+                data["keypoints"][interpolate_map, k, c] = np.interp(interpolate_ids, valid_ids, valid_kps[:, c])
             data["invalid"][interpolate_map, k] = False
 
         return data
@@ -2,7 +2,7 @@ from typing import List, Tuple, Union
 
 import numpy as np
 
-from . import random_utils
+from . import _kernels, random_utils
 from .transform import BaseTransform
 
 
@@ -41,53 +41,51 @@ class Jittering(BaseTransform):
 
     def apply(self, **data):
         assert data["keypoints"].shape[2] == 2, "Jittering only works with 2D coordinates"
-        keypoints = np.transpose(data["keypoints"], (2, 0, 1))  # C T V
+        length, num_joints = data["invalid"].shape
         valid = np.invert(data["invalid"])
 
-        # Calculate bounding boxes
-        bottom_left_bb = np.min(keypoints, axis=2, where=valid, initial=np.inf)
-        bottom_left_bb[bottom_left_bb == np.inf] = 0
-        top_right_bb = np.max(keypoints, axis=2, where=valid, initial=np.NINF)
-        top_right_bb[top_right_bb == np.NINF] = 0
-
-        for i in range(data["keypoints"].shape[0]):
-            if self.keypoint:
-                keypoint_id = self.keypoint
-            else:
-                keypoint_id = random_utils.randint(0, data["keypoints"].shape[1])
-            if data["invalid"][i, keypoint_id]:  # Skip invalid keypoints
-                continue
-
-            keypoint = data["keypoints"][i, keypoint_id]
-            direction = self._get_random_direction()
-            distance = self._get_random_distance()
-            new_kp = keypoint + distance * direction
-            new_kp = self._clip_bb(new_kp, bottom_left_bb[:, i], top_right_bb[:, i], direction)
-            data["keypoints"][i, keypoint_id] = new_kp
+        random_state = random_utils.get_random_state()
+        if self.keypoint is not None:
+            keypoint_ids = np.full(length, self.keypoint)
+        else:
+            keypoint_ids = random_utils.randint(0, num_joints, size=length, random_state=random_state)
+        frames = np.flatnonzero(valid[np.arange(length), keypoint_ids])  # Skip invalid keypoints
+        keypoint_ids = keypoint_ids[frames]
+
+        # Calculate bounding boxes of the jittered frames only, which always contain the valid jittered keypoint.
+        # Channels first, so the reductions run over the contiguous last axis
+        keypoints = np.ascontiguousarray(np.transpose(data["keypoints"][frames], (2, 0, 1)))  # C F V
+        frames_valid = valid[frames]
+        bottom_left_bb = np.where(frames_valid, keypoints, np.inf).min(axis=2).T  # F C
+        top_right_bb = np.where(frames_valid, keypoints, -np.inf).max(axis=2).T  # F C
+
+        directions = self._get_random_directions(len(frames), random_state)
+        distances = self._get_random_distances(len(frames), random_state)
+        new_kps = data["keypoints"][frames, keypoint_ids] + distances[:, None] * directions
+        if _kernels.NUMBA_AVAILABLE:
+            _kernels.clip_bb(new_kps, bottom_left_bb, top_right_bb, directions)
+        else:
+            new_kps = self._clip_bb(new_kps, bottom_left_bb, top_right_bb, directions)
+        data["keypoints"][frames, keypoint_ids] = new_kps
         return data
 
-    def _get_random_direction(self):
-        radian = random_utils.uniform(self.radians[0], self.radians[1])
-        return np.array([np.cos(radian), np.sin(radian)])
-
-    def _get_random_distance(self) -> float:
-        return random_utils.uniform(self.distance[0], self.distance[1])
-
-    def _clip_bb(self, keypoint, bottom_left, top_right, direction):
-        # Check if keypoint is outside of bb
-        if (keypoint < bottom_left).any() or (keypoint > top_right).any():
-            db = keypoint - bottom_left
-            dt = keypoint - top_right
-            db[db > 0] = 0
-            dt[dt < 0] = 0
-            temp_direction = direction.copy()
-            temp_direction[temp_direction == 0.0] = np.inf
-            db /= temp_direction
-            dt /= temp_direction
-            d = np.concatenate((db, dt))
-            dm = np.max(d)  # Distance in direction keypoint is outside of bb
-            keypoint = keypoint - dm * direction
-        return keypoint
+    def _get_random_directions(self, size: int, random_state: np.random.Generator):
+        radians = random_utils.uniform(self.radians[0], self.radians[1], size, random_state)
+        return np.stack((np.cos(radians), np.sin(radians)), axis=1)
+
+    def _get_random_distances(self, size: int, random_state: np.random.Generator):
+        return random_utils.uniform(self.distance[0], self.distance[1], size, random_state)
+
+    def _clip_bb(self, keypoints, bottom_left, top_right, directions):
+        # Distance in each dimension the keypoints are outside of the bb, zero if inside
+        db = np.minimum(keypoints - bottom_left, 0)
+        dt = np.maximum(keypoints - top_right, 0)
+        temp_directions = np.where(directions == 0.0, np.inf, directions)
+        db /= temp_directions
+        dt /= temp_directions
+        d = np.concatenate((db, dt), axis=1)
+        dm = np.max(d, axis=1)  # Distance in direction the keypoints are outside of bb
+        return keypoints - dm[:, None] * directions
 
 
 class MovePerturbation(BaseTransform):
@@ -105,15 +103,15 @@ class MovePerturbation(BaseTransform):
     ):
         super().__init__(always_apply, p)
         self.variance = variance
-        self.joints = joints
+        self.joints = np.asarray(joints, dtype=np.intp) if joints else None
 
     def apply(self, **data):
         shape = data["keypoints"].shape
-        if self.joints:
+        if self.joints is not None:
             shape = list(shape)
             shape[1] = len(self.joints)
         d = random_utils.normal(0, self.variance, shape)
-        if self.joints:
+        if self.joints is not None:
             d[data["invalid"][:, self.joints]] = 0.0
             data["keypoints"][:, self.joints] += d
         else:
@@ -134,12 +132,8 @@ class SwapPerturbation(BaseTransform):
 
     def apply(self, **data):
         length = data["keypoints"].shape[1]
-        i1 = i2 = 0
-        while i1 == i2:
-            [i1, i2] = random_utils.randint(0, length, 2)
-        temp = data["keypoints"][:, i1].copy()
-        data["keypoints"][:, i1] = data["keypoints"][:, i2]
-        data["keypoints"][:, i2] = temp
+        i1, i2 = random_utils.choice(length, size=2, replace=False)
+        data["keypoints"][:, [i1, i2]] = data["keypoints"][:, [i2, i1]]
 
         return data
 
@@ -160,11 +154,14 @@ class MirrorPerturbation(BaseTransform):
     ):
         super().__init__(always_apply, p)
         self.opposite_points = opposite_points
+        pairs = np.asarray(opposite_points, dtype=np.intp).reshape(-1, 2)
+        if len(np.unique(pairs)) != pairs.size:
+            raise ValueError("Invalid opposite points. Each keypoint can only be part of one pair")
+        self.target_ids = pairs.reshape(-1)
+        self.source_ids = pairs[:, ::-1].reshape(-1)
 
     def apply(self, **data):
-        for [p, q] in self.opposite_points:
-            temp = data["keypoints"][:, p].copy()
-            data["keypoints"][:, p] = data["keypoints"][:, q]
-            data["keypoints"][:, q] = temp
+        # The fancy-indexed read is a copy, so all pairs are swapped in one gather and one scatter
+        data["keypoints"][:, self.target_ids] = data["keypoints"][:, self.source_ids]
 
         return data
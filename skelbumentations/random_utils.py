@@ -11,38 +11,40 @@ IntNumType = Union[int, np.ndarray]
 Size = Union[int, Sequence[int]]
 
 
-def get_random_state() -> np.random.RandomState:
-    return np.random.RandomState(py_random.randint(0, (1 << 32) - 1))
+def get_random_state() -> np.random.Generator:
+    # Seeded from Python's `random`, so `random.seed` keeps augmentations reproducible and forked workers diverge.
+    # Constructing a PCG64 Generator is also an order of magnitude cheaper than a legacy RandomState.
+    return np.random.default_rng(py_random.randint(0, (1 << 32) - 1))
 
 
 def uniform(
     low: NumType = 0.0,
     high: NumType = 1.0,
     size: Optional[Size] = None,
-    random_state: Optional[np.random.RandomState] = None,
+    random_state: Optional[np.random.Generator] = None,
 ) -> Any:
     if random_state is None:
         random_state = get_random_state()
     return random_state.uniform(low, high, size)
 
 
-def rand(d0: NumType, d1: NumType, *more, random_state: Optional[np.random.RandomState] = None, **kwargs) -> Any:
+def rand(d0: NumType, d1: NumType, *more, random_state: Optional[np.random.Generator] = None, **kwargs) -> Any:
     if random_state is None:
         random_state = get_random_state()
-    return random_state.rand(d0, d1, *more, **kwargs)  # type: ignore
+    return random_state.random((d0, d1, *more), **kwargs)  # type: ignore
 
 
-def randn(d0: NumType, d1: NumType, *more, random_state: Optional[np.random.RandomState] = None, **kwargs) -> Any:
+def randn(d0: NumType, d1: NumType, *more, random_state: Optional[np.random.Generator] = None, **kwargs) -> Any:
     if random_state is None:
         random_state = get_random_state()
-    return random_state.randn(d0, d1, *more, **kwargs)  # type: ignore
+    return random_state.standard_normal((d0, d1, *more), **kwargs)  # type: ignore
 
 
 def normal(
     loc: NumType = 0.0,
     scale: NumType = 1.0,
     size: Optional[Size] = None,
-    random_state: Optional[np.random.RandomState] = None,
+    random_state: Optional[np.random.Generator] = None,
 ) -> Any:
     if random_state is None:
         random_state = get_random_state()
@@ -52,7 +54,7 @@ def normal(
 def poisson(
     lam: NumType = 1.0,
     size: Optional[Size] = None,
-    random_state: Optional[np.random.RandomState] = None,
+    random_state: Optional[np.random.Generator] = None,
 ) -> Any:
     if random_state is None:
         random_state = get_random_state()
@@ -61,7 +63,7 @@ def poisson(
 
 def permutation(
     x: Union[int, Sequence[float], np.ndarray],
-    random_state: Optional[np.random.RandomState] = None,
+    random_state: Optional[np.random.Generator] = None,
 ) -> Any:
     if random_state is None:
         random_state = get_random_state()
@@ -73,14 +75,14 @@ def randint(
     high: Optional[IntNumType] = None,
     size: Optional[Size] = None,
     dtype: Type = np.int32,
-    random_state: Optional[np.random.RandomState] = None,
+    random_state: Optional[np.random.Generator] = None,
 ) -> Any:
     if random_state is None:
         random_state = get_random_state()
-    return random_state.randint(low, high, size, dtype)
+    return random_state.integers(low, high, size, dtype)
 
 
-def random(size: Optional[NumType] = None, random_state: Optional[np.random.RandomState] = None) -> Any:
+def random(size: Optional[NumType] = None, random_state: Optional[np.random.Generator] = None) -> Any:
     if random_state is None:
         random_state = get_random_state()
     return random_state.random(size)  # type: ignore
@@ -91,7 +93,7 @@ def choice(
     size: Optional[Size] = None,
     replace: bool = True,
     p: Optional[Union[Sequence[float], np.ndarray]] = None,
-    random_state: Optional[np.random.RandomState] = None,
+    random_state: Optional[np.random.Generator] = None,
 ) -> Any:
     if random_state is None:
         random_state = get_random_state()
@@ -1,29 +1,34 @@
 import random
-from typing import List, Union
+from typing import List, Optional, Union
 
 import numpy as np
 
-from . import random_utils
+from . import _kernels, random_utils
 
 
 class BaseSelect:
-    def __init__(self, transforms, p: float):
+    def __init__(self, transforms, p: float, random_state: Optional[np.random.Generator] = None):
         self.transforms = transforms
         self.p = p
+        self.random_state = random_state
 
     def __call__(self, force_apply: bool = False, **data):
         if not (force_apply or random.random() < self.p):
             return data
 
-        select_ids = self.get_selection(**data)
+        select_ids = _as_slice(self.get_selection(**data), len(data["keypoints"]))
         select_data = {}
         for key, d in data.items():
             select_data[key] = d[select_ids]
+        selected = select_data.copy()
 
         for t in self.transforms:
             select_data = t(**select_data)
 
         for key, d in data.items():
+            # Slicing an array returns a view, which in place transforms already modified
+            if isinstance(select_ids, slice) and isinstance(d, np.ndarray) and select_data[key] is selected[key]:
+                continue
             d[select_ids] = select_data[key]
 
         return data
@@ -31,6 +36,25 @@ class BaseSelect:
     def get_selection(self, **data):
         raise NotImplementedError
 
+    def get_random_state(self) -> np.random.Generator:
+        if self.random_state is None:
+            return random_utils.get_random_state()
+        return self.random_state
+
+
+def _as_slice(select_ids, length: int):
+    # Contiguous increasing ids are converted to a slice, so the selection is a view instead of a copy.
+    # Masks and out of range ids are left to fancy indexing, which still raises for the latter
+    if isinstance(select_ids, slice):
+        return select_ids
+    ids = np.asarray(select_ids)
+    if not (np.issubdtype(ids.dtype, np.integer) and ids.ndim == 1 and ids.size > 0):
+        return select_ids
+    if ids[0] >= 0 and ids[-1] < length and ids[-1] - ids[0] + 1 == ids.size:
+        if ids.size == 1 or (np.diff(ids) == 1).all():
+            return slice(int(ids[0]), int(ids[-1]) + 1)
+    return select_ids
+
 
 class SelectRandomFrames(BaseSelect):
     """Randomly select frames. The transforms inside this selection are only applied to this selection.
@@ -41,6 +65,8 @@ class SelectRandomFrames(BaseSelect):
         max_num (int, optional): maximum number of frames to select. Defaults to 1.
         min_num (int, optional): minimum number of frames to select. Defaults to 1.
         contiguous (bool, optional): Wether the frames should be selected contiguously. Defaults to True.
+        random_state (np.random.Generator | None, optional): generator for the random draws.
+            None draws from a new generator seeded by `random` for every selection. Defaults to None.
     """
 
     def __init__(
@@ -50,8 +76,9 @@ class SelectRandomFrames(BaseSelect):
         max_num: int = 1,
         min_num: int = 1,
         contiguous: bool = True,
+        random_state: Optional[np.random.Generator] = None,
     ):
-        super().__init__(transforms, p)
+        super().__init__(transforms, p, random_state)
         assert max_num >= min_num, "max_num cannot be smaller than min_num"
         self.min_num = min_num
         self.max_num = max_num
@@ -59,13 +86,14 @@ class SelectRandomFrames(BaseSelect):
 
     def get_selection(self, **data):
         length = len(data["keypoints"])
-        size = random_utils.randint(self.min_num, self.max_num + 1)
+        random_state = self.get_random_state()
+        size = random_utils.randint(self.min_num, self.max_num + 1, random_state=random_state)
         if self.contiguous:
-            start = random_utils.randint(0, length - size + 1)
+            start = random_utils.randint(0, length - size + 1, random_state=random_state)
             end = start + size
             select_ids = np.arange(start, end)
         else:
-            select_ids = random_utils.choice(length, size=size, replace=False)
+            select_ids = random_utils.choice(length, size=size, replace=False, random_state=random_state)
 
         return select_ids
 
@@ -83,9 +111,18 @@ class SelectFrames(BaseSelect):
         super().__init__(transforms, p)
         self.frames = frames
 
+    @property
+    def frames(self) -> np.ndarray:
+        return self._frames
+
+    @frames.setter
+    def frames(self, frames: List[int]):
+        self._frames = np.asarray(frames, dtype=np.intp)
+        assert self._frames.size == 0 or self._frames.min() >= 0, "A frame number is out of range"
+        self._max_frame = int(self._frames.max()) if self._frames.size else -1
+
     def get_selection(self, **data):
-        length = len(data["keypoints"])
-        assert all(f in range(length) for f in self.frames), "A frame number is out of range"
+        assert self._max_frame < len(data["keypoints"]), "A frame number is out of range"
         return self.frames
 
 
@@ -99,6 +136,8 @@ class SelectRandomWithBorder(BaseSelect):
         max_num (int, optional): maximum number of frames to select. Defaults to 1.
         min_num (int, optional): minimum number of frames to select. Defaults to 1.
         border_num (int, optional): number of border frames on each side. Defaults to 1.
+        random_state (np.random.Generator | None, optional): generator for the random draws.
+            None draws from a new generator seeded by `random` for every selection. Defaults to None.
     """
 
     def __init__(
@@ -109,18 +148,24 @@ class SelectRandomWithBorder(BaseSelect):
         min_num: int = 1,
         max_num: int = 25,
         border_num=1,
+        random_state: Optional[np.random.Generator] = None,
     ):
-        inner_size = random_utils.randint(min_num, max_num + 1)
-        self.size = inner_size + 2 * border_num
+        assert max_num >= min_num, "max_num cannot be smaller than min_num"
+        self.min_num = min_num
+        self.max_num = max_num
         self.border_num = border_num
-        inner_frames = np.arange(border_num, border_num + inner_size)
-        combined_transforms = [SelectFrames(inner_transforms, inner_frames, p=1.0)] + transforms
-        super().__init__(combined_transforms, p)
+        # The inner frames are set for every selection, because the inner size is drawn per call
+        self.inner_select = SelectFrames(inner_transforms, [], p=1.0)
+        super().__init__([self.inner_select] + transforms, p, random_state)
 
     def get_selection(self, **data):
         length = len(data["keypoints"])
-        start = random_utils.randint(0, length - self.size + 1)
-        end = start + self.size
+        random_state = self.get_random_state()
+        inner_size = random_utils.randint(self.min_num, self.max_num + 1, random_state=random_state)
+        size = inner_size + 2 * self.border_num
+        self.inner_select.frames = np.arange(self.border_num, self.border_num + inner_size)
+        start = random_utils.randint(0, length - size + 1, random_state=random_state)
+        end = start + size
         select_ids = np.arange(start, end)
 
         return select_ids
@@ -138,6 +183,8 @@ class SelectHighMovement(BaseSelect):
             None means all the keypoints are used. Defaults to None.
         contiguous (bool, optional): Wether the frames should be selected contiguously.
             If so, the contiguous frames with the highest keypoint movement are selected. Defaults to True.
+        random_state (np.random.Generator | None, optional): generator for drawing the number of frames.
+            None draws from a new generator seeded by `random`. Defaults to None.
     """
 
     def __init__(
@@ -148,34 +195,34 @@ class SelectHighMovement(BaseSelect):
         max_num: int = 20,
         part: Union[List[int], None] = None,
         contiguous: bool = True,
+        random_state: Optional[np.random.Generator] = None,
     ):
-        super().__init__(transforms, p)
-        self.size = random_utils.randint(min_num, max_num + 1)
+        super().__init__(transforms, p, random_state)
+        self.size = random_utils.randint(min_num, max_num + 1, random_state=self.get_random_state())
         self.part = part
         self.contiguous = contiguous
 
     def get_selection(self, **data):
         keypoints = data["keypoints"]
         invalid = data["invalid"]
-        length = len(keypoints)
         if self.part:
             keypoints = keypoints[:, self.part]
             invalid = invalid[:, self.part]
         movement = keypoints[1:] - keypoints[:-1]
-        movement = np.linalg.norm(movement, axis=2)
-        for f, frame in enumerate(movement):
-            for k, kp in enumerate(frame):
-                if invalid[f, k] or invalid[f + 1, k]:
-                    movement[f, k] = 0.0
+        if movement.shape[2] == 2:
+            movement = np.hypot(movement[..., 0], movement[..., 1])
+        else:
+            movement = np.linalg.norm(movement, axis=2)
+        movement[invalid[:-1] | invalid[1:]] = 0.0
         movement = np.mean(movement, axis=1)
         if self.contiguous:
-            max_sum = 0
-            max_index = 0
-            for i in range(length - self.size):
-                sum = np.sum(movement[i : i + self.size])
-                if sum > max_sum:
-                    max_sum = sum
-                    max_index = i
+            if _kernels.NUMBA_AVAILABLE:
+                max_index = _kernels.window_max_sum(movement, self.size)
+            elif self.size >= len(movement):
+                max_index = 0
+            else:
+                window_sums = np.convolve(movement, np.ones(self.size, dtype=movement.dtype), mode="valid")
+                max_index = int(np.argmax(window_sums))
             ids = np.arange(start=max_index, stop=max_index + self.size)
         else:
             ids = np.argsort(movement)[-self.size :]
@@ -9,7 +9,7 @@ class BaseTransform:
         self.always_apply = always_apply
 
     def __call__(self, force_apply: bool = False, **data):
-        if (random.random() < self.p) or self.always_apply or force_apply:
+        if force_apply or self.always_apply or random.random() < self.p:
             return self.apply(**data)
         else:
             return data
@@ -31,5 +31,7 @@ class HorizontalFlip(BaseTransform):
         super().__init__(always_apply, p)
 
     def apply(self, **data):
-        data["keypoints"][:, :, 0] = 2 * self.flip_axis - data["keypoints"][:, :, 0]
+        x = data["keypoints"][..., 0]
+        # Unsafe casting keeps integer keypoints working, like the assignment to the view did
+        np.subtract(2 * self.flip_axis, x, out=x, casting="unsafe")
         return data
@@ -0,0 +1,19 @@
+import pytest
+
+from skelbumentations import _kernels
+
+NUMBA_AVAILABLE = _kernels.NUMBA_AVAILABLE
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(True, marks=pytest.mark.skipif(not NUMBA_AVAILABLE, reason="Numba is not installed")),
+        False,
+    ],
+    ids=["jit", "numpy"],
+)
+def jit(request, monkeypatch):
+    # Runs the test with the Numba kernels and with the NumPy fallbacks
+    if not request.param:
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+    return request.param
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, Mock
 import numpy as np
 import pytest
 
+from skelbumentations import SpecificOcclusion
 from skelbumentations.compose import (
     Compose,
     NoOp,
@@ -54,6 +55,53 @@ def test_compose_missing_invalid(data):
     np.testing.assert_equal(data["invalid"], result["invalid"])
 
 
+def test_compose_dtype(data):
+    augmentation = Compose([], p=1, dtype=np.float32)
+    result = augmentation(**data)
+    assert result["keypoints"].dtype == np.float32
+    np.testing.assert_equal(result["keypoints"], data["keypoints"])
+
+
+def test_compose_apply_batch():
+    augmentation = Compose([SpecificOcclusion(joints=[1, 3])], p=1)
+    result = augmentation.apply_batch(np.ones((4, 100, 17, 3)))
+    expected_invalid = np.full((4, 100, 17), False)
+    expected_invalid[:, :, [1, 3]] = True
+    expected_keypoints = np.ones((4, 100, 17, 3))
+    expected_keypoints[expected_invalid] = 0.0
+    np.testing.assert_equal(result["invalid"], expected_invalid)
+    np.testing.assert_equal(result["keypoints"], expected_keypoints)
+
+
+def test_compose_apply_batch_replaced_arrays():
+    def replace(**data):
+        return {"keypoints": data["keypoints"] + 1.0, "invalid": np.logical_not(data["invalid"])}
+
+    augmentation = Compose([replace], p=1, set_invalid_to_zero=False)
+    keypoints = np.ones((4, 100, 17, 3))
+    invalid = np.full((4, 100, 17), False)
+    result = augmentation.apply_batch(keypoints, invalid)
+    assert result["keypoints"] is keypoints
+    assert result["invalid"] is invalid
+    np.testing.assert_equal(keypoints, 2.0)
+    assert invalid.all()
+
+
+def test_compose_apply_batch_dtype():
+    augmentation = Compose([SpecificOcclusion(joints=[1, 3])], p=1, dtype=np.float32)
+    keypoints = np.ones((4, 100, 17, 3))
+    result = augmentation.apply_batch(keypoints)
+    assert result["keypoints"].dtype == np.float32
+    assert (result["keypoints"][:, :, [1, 3]] == 0.0).all()
+    np.testing.assert_equal(keypoints, 1.0)
+
+
+def test_compose_apply_batch_single_sequence(data):
+    augmentation = Compose([], p=1)
+    with pytest.raises(AssertionError):
+        augmentation.apply_batch(data["keypoints"])
+
+
 def test_one_of(data):
     transforms = [Mock(p=1) for _ in range(10)]
     augmentation = OneOf(transforms, p=1)
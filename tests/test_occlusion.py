@@ -2,7 +2,12 @@ import random
 
 import numpy as np
 
-from skelbumentations import RandomOcclusion, SpecificOcclusion, WholeOcclusion
+from skelbumentations import (
+    InterpolateOcclusions,
+    RandomOcclusion,
+    SpecificOcclusion,
+    WholeOcclusion,
+)
 
 
 def test_random_occlusion():
@@ -10,7 +15,7 @@ def test_random_occlusion():
     random.seed(1998)
     result = augment(keypoints=np.ones((100, 17, 3)), invalid=np.full((100, 17), False))["invalid"]
     expected_result = np.full((100, 17), False)
-    expected_result[:, [6, 9]] = True
+    expected_result[:, [8, 13, 16]] = True
     np.testing.assert_equal(result, expected_result)
 
 
@@ -27,3 +32,20 @@ def test_specific_occlusion():
     expected_result = np.full((100, 17), False)
     expected_result[:, [1, 3]] = True
     np.testing.assert_equal(result, expected_result)
+
+
+def test_interpolate_occlusions(jit):
+    augment = InterpolateOcclusions()
+    keypoints = np.repeat(np.arange(100, dtype=float)[:, None, None], 17, axis=1).repeat(3, axis=2)
+    invalid = np.full((100, 17), False)
+    invalid[:5, 1] = True
+    invalid[40:60, 2] = True
+    invalid[90:, 3] = True
+    invalid[:, 4] = True
+    result = augment(keypoints=np.where(invalid[..., None], 0.0, keypoints), invalid=invalid.copy())
+    expected_invalid = np.full((100, 17), False)
+    expected_invalid[:5, 1] = True
+    expected_invalid[90:, 3] = True
+    expected_invalid[:, 4] = True
+    np.testing.assert_equal(result["invalid"], expected_invalid)
+    np.testing.assert_allclose(result["keypoints"][~expected_invalid], keypoints[~expected_invalid])
@@ -1,8 +1,15 @@
 import random
 
 import numpy as np
+import pytest
 
-from skelbumentations import MovePerturbation, random_utils
+from skelbumentations import (
+    Jittering,
+    MirrorPerturbation,
+    MovePerturbation,
+    SwapPerturbation,
+    random_utils,
+)
 
 
 def test_move_pertubation():
@@ -13,3 +20,68 @@ def test_move_pertubation():
     invalid[5] = True
     data = augment(keypoints=data, invalid=invalid)
     assert (data["keypoints"][5] == 0.0).all()
+
+
+def test_move_pertubation_joints():
+    augment = MovePerturbation(variance=0.5, joints=[1, 3])
+    keypoints = np.ones((100, 17, 3), dtype=float)
+    invalid = np.full((100, 17), False)
+    invalid[5] = True
+    data = augment(keypoints=keypoints.copy(), invalid=invalid)
+    moved = (data["keypoints"] != keypoints).any(axis=2)
+    assert not moved[:, [0, 2] + list(range(4, 17))].any()
+    assert not moved[5].any()
+    assert moved[:, [1, 3]].sum() == 2 * 99
+
+
+def test_jittering(jit):
+    random.seed(1998)
+    augment = Jittering(distance=(0.5, 2.0))
+    keypoints = random_utils.uniform(0, 10, (100, 17, 2))
+    invalid = np.full((100, 17), False)
+    invalid[:, 0] = True
+    data = augment(keypoints=keypoints.copy(), invalid=invalid)
+    moved = (data["keypoints"] != keypoints).any(axis=2)
+    assert (moved.sum(axis=1) <= 1).all()
+    # Only frames choosing the invalid joint or pushing an extreme joint outwards keep their keypoints
+    assert moved.any(axis=1).sum() >= 75
+    assert not moved[:, 0].any()
+    assert (data["keypoints"][:, 1:] >= keypoints[:, 1:].min(axis=1, keepdims=True) - 1e-9).all()
+    assert (data["keypoints"][:, 1:] <= keypoints[:, 1:].max(axis=1, keepdims=True) + 1e-9).all()
+
+
+@pytest.mark.parametrize(
+    "angle,expected_keypoint",
+    [(0, [1.0, 0.5]), (45, [1.0, 1.0]), (90, [0.5, 1.0]), (180, [0.0, 0.5])],
+)
+def test_jittering_clip(jit, angle, expected_keypoint):
+    augment = Jittering(angles=(angle, angle), distance=(5.0, 5.0), keypoint=1)
+    keypoints = np.array([[[0.0, 0.0], [0.5, 0.5], [1.0, 1.0]]]).repeat(10, axis=0)
+    data = augment(keypoints=keypoints.copy(), invalid=np.full((10, 3), False))
+    # The jittered keypoint is clipped to the edge of the bounding box along its direction
+    np.testing.assert_allclose(data["keypoints"][:, 1], np.tile(expected_keypoint, (10, 1)), atol=1e-9)
+    np.testing.assert_equal(data["keypoints"][:, [0, 2]], keypoints[:, [0, 2]])
+
+
+def test_swap_pertubation():
+    random.seed(1998)
+    augment = SwapPerturbation()
+    keypoints = random_utils.uniform(0, 10, (100, 17, 3))
+    data = augment(keypoints=keypoints.copy(), invalid=np.full((100, 17), False))
+    swapped = np.flatnonzero((data["keypoints"] != keypoints).any(axis=(0, 2)))
+    assert len(swapped) == 2
+    np.testing.assert_equal(data["keypoints"][:, swapped], keypoints[:, swapped[::-1]])
+
+
+def test_mirror_pertubation():
+    random.seed(1998)
+    augment = MirrorPerturbation(opposite_points=[[1, 2], [5, 3]])
+    keypoints = random_utils.uniform(0, 10, (100, 17, 3))
+    data = augment(keypoints=keypoints.copy(), invalid=np.full((100, 17), False))
+    expected_keypoints = keypoints[:, [0, 2, 1, 5, 4, 3] + list(range(6, 17))]
+    np.testing.assert_equal(data["keypoints"], expected_keypoints)
+
+
+def test_mirror_pertubation_repeated_keypoint():
+    with pytest.raises(ValueError):
+        MirrorPerturbation(opposite_points=[[1, 2], [2, 3]])
@@ -1,4 +1,3 @@
-import random
 from typing import Any
 
 import numpy as np
@@ -13,14 +12,18 @@ from skelbumentations.select import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def data():
-    invalid = np.full((100, 17), False)
+    invalid = np.zeros((100, 17), dtype=bool)
     invalid[20] = True
-    keypoints = np.ones((100, 17, 3), dtype=float)
+    keypoints = np.empty((100, 17, 3), dtype=float)
+    keypoints.fill(1.0)
     keypoints[20] = 0
     keypoints[5, 10] = 5
     keypoints[70, 2] = 3
+    # Shared by all tests of the module, tests that modify the data have to copy it
+    keypoints.setflags(write=False)
+    invalid.setflags(write=False)
     return {"keypoints": keypoints, "invalid": invalid}
 
 
@@ -29,46 +32,83 @@ def test_base_select(data):
     expected_data = {"keypoints": data["keypoints"].copy(), "invalid": data["invalid"].copy()}
     expected_data["invalid"][55] = True
     expected_data["keypoints"][55] = 11
-    data = select(**data)
+    data = select(keypoints=data["keypoints"].copy(), invalid=data["invalid"].copy())
     np.testing.assert_equal(data["invalid"], expected_data["invalid"])
     np.testing.assert_equal(data["keypoints"], expected_data["keypoints"])
 
 
-def test_select_random_frames_full_size(data):
-    select = SelectRandomFrames([], max_num=100, min_num=100, contiguous=True)
-    selection = select.get_selection(**data)
-    expected_selection = np.arange(100)
-    np.testing.assert_equal(selection, expected_selection)
+def test_base_select_contiguous(data):
+    select = SelectFrames([MockTransform()], [50, 51, 52])
+    expected_data = {"keypoints": data["keypoints"].copy(), "invalid": data["invalid"].copy()}
+    expected_data["invalid"][51] = True
+    expected_data["keypoints"][51] = 11
+    data = select(keypoints=data["keypoints"].copy(), invalid=data["invalid"].copy())
+    np.testing.assert_equal(data["invalid"], expected_data["invalid"])
+    np.testing.assert_equal(data["keypoints"], expected_data["keypoints"])
 
 
-def test_select_random_frames(data):
-    select = SelectRandomFrames([], max_num=10, min_num=5, contiguous=True)
-    random.seed(1998)
+@pytest.mark.parametrize(
+    "select_cls,kwargs,seed,expected_selection",
+    [
+        pytest.param(
+            SelectRandomFrames,
+            dict(max_num=100, min_num=100, contiguous=True),
+            None,
+            np.arange(100),
+            id="random_frames_full_size",
+        ),
+        pytest.param(
+            SelectRandomFrames,
+            dict(max_num=10, min_num=5, contiguous=True),
+            1998,
+            np.arange(50, 58),
+            id="random_frames",
+        ),
+        pytest.param(SelectFrames, dict(frames=[4, 8, 44]), None, [4, 8, 44], id="frames"),
+        pytest.param(
+            SelectHighMovement,
+            dict(max_num=5, min_num=3, contiguous=True),
+            1998,
+            [2, 3, 4, 5],
+            id="high_movement",
+        ),
+        pytest.param(
+            SelectHighMovement,
+            dict(max_num=1, min_num=1, contiguous=True, part=[2]),
+            None,
+            [69],
+            id="high_part_movement",
+        ),
+    ],
+)
+def test_get_selection(data, select_cls, kwargs, seed, expected_selection):
+    if seed is not None:
+        kwargs = dict(kwargs, random_state=np.random.default_rng(seed))
+    select = select_cls([], **kwargs)
     selection = select.get_selection(**data)
-    expected_selection = np.arange(85, 94)
     np.testing.assert_equal(selection, expected_selection)
 
 
-def test_select_frames(data):
-    expected_selection = [4, 8, 44]
-    select = SelectFrames([], expected_selection)
-    selection = select.get_selection(**data)
-    np.testing.assert_equal(selection, expected_selection)
+def test_select_high_movement_single_frame(jit):
+    select = SelectHighMovement([], max_num=1, min_num=1, contiguous=True)
+    selection = select.get_selection(keypoints=np.ones((1, 17, 3)), invalid=np.zeros((1, 17), dtype=bool))
+    np.testing.assert_equal(selection, [0])
 
 
-def test_select_high_movement(data):
-    select = SelectHighMovement([], max_num=5, min_num=3, contiguous=True)
-    random.seed(1998)
-    selection = select.get_selection(**data)
-    expected_selection = [3, 4, 5]
-    np.testing.assert_equal(selection, expected_selection)
+def test_base_select_mask(data):
+    select = MaskSelect([MockTransform()], np.arange(100) >= 50)
+    expected_data = {"keypoints": data["keypoints"].copy(), "invalid": data["invalid"].copy()}
+    expected_data["invalid"][51] = True
+    expected_data["keypoints"][51] = 11
+    data = select(keypoints=data["keypoints"].copy(), invalid=data["invalid"].copy())
+    np.testing.assert_equal(data["invalid"], expected_data["invalid"])
+    np.testing.assert_equal(data["keypoints"], expected_data["keypoints"])
 
 
-def test_select_high_part_movement(data):
-    select = SelectHighMovement([], max_num=1, min_num=1, contiguous=True, part=[2])
-    selection = select.get_selection(**data)
-    expected_selection = [69]
-    np.testing.assert_equal(selection, expected_selection)
+def test_select_high_movement_too_many_frames():
+    select = SelectHighMovement([], max_num=20, min_num=20, contiguous=True)
+    with pytest.raises(IndexError):
+        select(keypoints=np.ones((10, 17, 3)), invalid=np.zeros((10, 17), dtype=bool))
 
 
 def test_random_frames_with_border_select():
@@ -78,25 +118,45 @@ def test_random_frames_with_border_select():
         inner_transforms=[MockFill(2, 2)], transforms=[MockFill(3, 3)], min_num=50, max_num=50, border_num=25
     )
     result = augment(keypoints=keypoints, invalid=invalid)
-    expected_keypoints = keypoints.copy()
-    expected_keypoints[:, 3] = 3.0
-    expected_keypoints[25:75, 2] = 2.0
-    np.testing.assert_equal(result["invalid"], invalid)
-    np.testing.assert_equal(result["keypoints"], expected_keypoints)
+    assert not result["invalid"].any()
+    assert (result["keypoints"][:, 3] == 3.0).all()
+    assert (result["keypoints"][25:75, 2] == 2.0).all()
+    assert (result["keypoints"][:25, 2] == 1.0).all()
+    assert (result["keypoints"][75:, 2] == 1.0).all()
+    assert (result["keypoints"][:, [0, 1] + list(range(4, 17))] == 1.0).all()
+
+
+def test_random_frames_with_border_size_per_call(data):
+    select = SelectRandomWithBorder(inner_transforms=[], transforms=[], min_num=3, max_num=20, border_num=2)
+    sizes = {len(select.get_selection(**data)) for _ in range(100)}
+    assert len(sizes) > 1
+    assert min(sizes) >= 3 + 2 * 2
+    assert max(sizes) <= 20 + 2 * 2
 
 
 class MockTransform:
     def __call__(self, **data):
+        # The selections are handed over as contiguous arrays or views, so the rows are single contiguous writes
+        assert data["keypoints"].flags.c_contiguous
         data["invalid"][1] = True
         data["keypoints"][1] = 11
         return data
 
 
+class MaskSelect(BaseSelect):
+    def __init__(self, transforms, mask):
+        super().__init__(transforms, p=1.0)
+        self.mask = mask
+
+    def get_selection(self, **data):
+        return self.mask
+
+
 class MockFill:
     def __init__(self, number, joint):
         self.number = number
         self.joint = joint
 
     def __call__(self, **data):
-        data["keypoints"][:, self.joint] = self.number
+        data["keypoints"][:, self.joint].fill(self.number)
         return data
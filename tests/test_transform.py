@@ -0,0 +1,20 @@
+import numpy as np
+
+from skelbumentations import Compose, HorizontalFlip
+
+
+def test_horizontal_flip():
+    augment = HorizontalFlip(flip_axis=0.5)
+    keypoints = np.ones((10, 17, 3), dtype=float)
+    keypoints[:, :, 0] = np.arange(17) / 16
+    data = augment(keypoints=keypoints.copy(), invalid=np.full((10, 17), False))
+    np.testing.assert_allclose(data["keypoints"][:, :, 0], 1.0 - keypoints[:, :, 0])
+    np.testing.assert_equal(data["keypoints"][:, :, 1:], keypoints[:, :, 1:])
+
+
+def test_horizontal_flip_integer_keypoints():
+    augment = Compose([HorizontalFlip(flip_axis=0.5)], p=1)
+    data = augment(keypoints=np.ones((10, 17, 2), dtype=np.int64))
+    assert data["keypoints"].dtype == np.int64
+    np.testing.assert_equal(data["keypoints"][:, :, 0], 0)
+    np.testing.assert_equal(data["keypoints"][:, :, 1], 1)